@@ -1,9 +1,10 @@
 import logging
+import operator
 import threading
 import datetime
 import time
 from functools import wraps
-from typing import Dict, Iterable, Optional, Union, List, Tuple
+from typing import Dict, Iterable, Optional, Union, List, Tuple, TYPE_CHECKING
 
 from libbs.api.utils import progress_bar
 from libbs.artifacts import (
@@ -13,7 +14,9 @@ from libbs.artifacts import (
     Enum, Struct, FunctionArgument, StructMember, Typedef
 )
 from libbs.api import DecompilerInterface
-from libbs.api.type_parser import CType
+
+if TYPE_CHECKING:
+    from libbs.api.type_parser import CType
 
 from binsync.core.client import Client, SchedSpeed, Scheduler, Job
 from binsync.core.state import State
@@ -51,8 +54,26 @@ def fill_event(f):
 
 # https://stackoverflow.com/questions/10926328
 BUSY_LOOP_COOLDOWN = 0.5
-GET_MANY = True
-FILL_MANY = True
+# pull-cadence backoff: each quiet pull stretches the interval by this factor, capped at
+# this multiple of reload_time; any remote or local activity snaps it back to reload_time
+PULL_BACKOFF_BASE = 1.3
+PULL_BACKOFF_MAX_MULT = 8
+
+# artifact-dict getters for changed_artifacts_of_type; attrgetter runs in C,
+# unlike a getattr(state, prop_name) per user
+_ARTIFACT_DICT_GETTERS = {
+    Function: operator.attrgetter("functions"),
+    Comment: operator.attrgetter("comments"),
+    GlobalVariable: operator.attrgetter("global_vars"),
+    Struct: operator.attrgetter("structs"),
+    Enum: operator.attrgetter("enums")
+}
+
+# status_string is rendered on every UI redraw; keep the templates precomputed
+_STATUS_CONNECTED_TMPL = "<font color=#1eba06>{}</font>"
+_STATUS_NO_REMOTE_TMPL = "<font color=#e7b416>{}</font>"
+_STATUS_LOADING_STR = "<font color=#ffa500>Loading...</font>"
+_STATUS_DISCONNECTED_STR = "<font color=#cc3232>Disconnected</font>"
 
 
 class SyncControlStatus:
@@ -97,23 +118,26 @@ class BSController:
         Typedef: State.set_typedef
     }
 
-    ARTIFACT_GET_MAP = {
+    ARTIFACT_GET_ONE = {
         Function: State.get_function,
-        (Function, GET_MANY): State.get_functions,
         FunctionHeader: State.get_function_header,
-        (FunctionHeader, GET_MANY): State.get_function_headers,
         StackVariable: State.get_stack_variable,
-        (StackVariable, GET_MANY): State.get_stack_variables,
         Comment: State.get_comment,
-        (Comment, GET_MANY): State.get_func_comments,
         GlobalVariable: State.get_global_var,
-        (GlobalVariable, GET_MANY): State.get_global_vars,
         Struct: State.get_struct,
-        (Struct, GET_MANY): State.get_structs,
         Enum: State.get_enum,
-        (Enum, GET_MANY): State.get_enums,
-        Typedef: State.get_typedef,
-        (Typedef, GET_MANY): State.get_typedefs
+        Typedef: State.get_typedef
+    }
+
+    ARTIFACT_GET_MANY = {
+        Function: State.get_functions,
+        FunctionHeader: State.get_function_headers,
+        StackVariable: State.get_stack_variables,
+        Comment: State.get_func_comments,
+        GlobalVariable: State.get_global_vars,
+        Struct: State.get_structs,
+        Enum: State.get_enums,
+        Typedef: State.get_typedefs
     }
 
     DEFAULT_SEMAPHORE_SIZE = 100
@@ -122,6 +146,9 @@ class BSController:
                  reload_time=10, **kwargs):
         self.headless = headless
         self.reload_time = reload_time
+        # current seconds between git update cycles; grows while the repo is idle (see
+        # updater_routine), so reload_time is the floor rather than a fixed cadence
+        self._pull_interval = reload_time
         if decompiler_interface is None:
             self.deci = DecompilerInterface.discover(thread_artifact_callbacks=False)
         else:
@@ -156,6 +183,12 @@ class BSController:
         self.ctx_change_callback = None  # func()
         self._last_reload = None
         self.last_active_func = None
+        # last-synced timestamps, keyed (user, artifact type, identifier), used to skip
+        # re-filling artifacts whose source state has not advanced since the last fill
+        self._last_sync_ts: Dict[Tuple, datetime.datetime] = {}
+        # parse results for type strings, keyed type_str -> base type name (None when the
+        # type is known/unparseable); parsing is state-independent, so entries never go stale
+        self._parsed_type_cache: Dict[str, Optional[str]] = {}
         self._got_first_state = False
         # ui worker that fires off requests for UI update
         self._ui_updater_thread = None
@@ -169,6 +202,8 @@ class BSController:
 
         # create a pulling thread, but start on connection
         self._run_updater_threads = False
+        self._updater_wake_event = threading.Event()
+        self._client_update_job: Optional[Job] = None
         self.user_states_update_thread = threading.Thread(target=self.updater_routine)
 
         if self.headless:
@@ -269,7 +304,7 @@ class BSController:
         wait_time = 0
         while wait_time < self.reload_time:
             if last_push != self.client.last_push_attempt_time:
-                if not self.push_job_scheduler._job_queue.empty():
+                if self.push_job_scheduler.jobs_pending():
                     # restart wait time when pusher still has jobs
                     start_time = time.time()
                 else:
@@ -278,9 +313,22 @@ class BSController:
             time.sleep(BUSY_LOOP_COOLDOWN * 2)
             wait_time = time.time() - start_time
 
+    def wake_updater_routine(self):
+        """
+        Wakes the updater routine immediately instead of waiting out the current cooldown.
+        Can be called from any thread.
+        """
+        self._updater_wake_event.set()
+
     def updater_routine(self):
         while self._run_updater_threads:
-            time.sleep(BUSY_LOOP_COOLDOWN)
+            # an interruptible sleep: anyone can call wake_updater_routine() to skip the cooldown,
+            # which also makes shutdowns (and tests) immediate instead of up-to-cooldown late
+            self._updater_wake_event.wait(timeout=BUSY_LOOP_COOLDOWN)
+            self._updater_wake_event.clear()
+            if not self._run_updater_threads:
+                break
+
             now = datetime.datetime.now(tz=datetime.timezone.utc)
 
             # validate a client is connected to this controller (which may be local only)
@@ -289,11 +337,23 @@ class BSController:
 
             # do git pull/push operations if a remote exist for the client
             if self.client.last_pull_attempt_time is None:
-                self.client.commit_and_update_states(commit_msg="User created")
+                self._schedule_client_update(commit_msg="User created")
 
-            # update every reload_time
+            # the backoff only applies to the incoming pull cadence: local changes waiting
+            # to be committed/pushed always run the cycle at reload_time, while quiet pulls
+            # with nothing outgoing stretch the interval until remote activity resets it
             elif int(now.timestamp() - self.client.last_pull_attempt_time.timestamp()) >= self.reload_time:
-                self.client.commit_and_update_states()
+                elapsed = int(now.timestamp() - self.client.last_pull_attempt_time.timestamp())
+                has_local_changes = self.client.has_local_changes()
+                if has_local_changes or elapsed >= self._pull_interval:
+                    if has_local_changes or self.client.last_pull_had_updates:
+                        self._pull_interval = self.reload_time
+                    else:
+                        self._pull_interval = min(
+                            self._pull_interval * PULL_BACKOFF_BASE,
+                            self.reload_time * PULL_BACKOFF_MAX_MULT
+                        )
+                    self._schedule_client_update()
 
             if not self.headless:
                 all_states = self.client.all_states()
@@ -317,6 +377,18 @@ class BSController:
                         Job(self._update_ui, all_states)
                     )
 
+    def _schedule_client_update(self, commit_msg=None):
+        """
+        Runs client.commit_and_update_states off the updater thread so a slow git pull/push
+        (network hiccups, big repos) never stalls context-change and UI-update dispatching.
+        At most one update job is ever in flight.
+        """
+        if self._client_update_job is not None and not self._client_update_job.finish_event.is_set():
+            return
+
+        self._client_update_job = Job(self.client.commit_and_update_states, commit_msg=commit_msg)
+        self.push_job_scheduler.schedule_job(self._client_update_job, priority=SchedSpeed.AVERAGE)
+
     def _update_ui(self, states):
         if not self.ui_callback:
             return
@@ -352,6 +424,7 @@ class BSController:
 
     def stop_worker_routines(self):
         self._run_updater_threads = False
+        self.wake_updater_routine()
         self.push_job_scheduler.stop_worker_thread()
         self._stop_ui_components()
 
@@ -383,13 +456,13 @@ class BSController:
     def status_string(self):
         stat = self.status()
         if stat == SyncControlStatus.CONNECTED:
-            return f"<font color=#1eba06>{self.client.master_user}</font>"
+            return _STATUS_CONNECTED_TMPL.format(self.client.master_user)
         elif stat == SyncControlStatus.CONNECTED_NO_REMOTE:
-            return f"<font color=#e7b416>{self.client.master_user}</font>"
+            return _STATUS_NO_REMOTE_TMPL.format(self.client.master_user)
         elif stat == SyncControlStatus.LOADING:
-            return f"<font color=#ffa500>Loading...</font>"
+            return _STATUS_LOADING_STR
         else:
-            return "<font color=#cc3232>Disconnected</font>"
+            return _STATUS_DISCONNECTED_STR
 
     def toggle_headless(self):
         self.headless = not self.headless
@@ -398,9 +471,10 @@ class BSController:
     def users(self, priority=None, no_cache=True) -> Iterable[User]:  # TODO: fix no_cache user bug
         return self.client.users(priority=priority, no_cache=no_cache)
 
+    @init_checker
     def usernames(self, priority=None) -> Iterable[str]:
-        for user in self.users(priority=priority):
-            yield user.name
+        # branch names alone are enough here; skips parsing every user's metadata
+        return self.client.user_names(priority=priority)
 
     def save_native_decompiler_database(self):
         """
@@ -422,7 +496,7 @@ class BSController:
     @init_checker
     def pull_artifact(self, type_: Artifact, *identifiers, many=False, user=None, state=None) -> Optional[Artifact]:
         try:
-            get_artifact_func = self.ARTIFACT_GET_MAP[type_] if not many else self.ARTIFACT_GET_MAP[(type_, GET_MANY)]
+            get_artifact_func = (self.ARTIFACT_GET_MANY if many else self.ARTIFACT_GET_ONE)[type_]
         except KeyError:
             _l.info(f"Attempting to pull an unsupported Artifact of type {type_} with {identifiers}")
             return None
@@ -455,7 +529,7 @@ class BSController:
 
     @init_checker
     def commit_artifact(self, artifact: Artifact, commit_msg=None, set_last_change=True, make_func=True, from_user=None,
-                        deleted=False, **kwargs) -> bool:
+                        deleted=False, defer_commit=False, **kwargs) -> bool:
         """
         This function is NOT thread safe. You must call it in the order you want commits to appear.
         Additionally, the Artifact must be LIFTED before committing it!
@@ -467,7 +541,7 @@ class BSController:
 
         try:
             set_art_func = self.ARTIFACT_SET_MAP[artifact.__class__]
-            get_art_func = self.ARTIFACT_GET_MAP[artifact.__class__]
+            get_art_func = self.ARTIFACT_GET_ONE[artifact.__class__]
         except KeyError:
             _l.info(f"Attempting to push an unsupported Artifact of type {artifact}")
             return False
@@ -502,7 +576,12 @@ class BSController:
 
         # TODO: make was_set reliable
         _l.debug(f"{state} committing now with {commit_msg}")
-        self.client.master_state = state
+        if defer_commit:
+            # update the cached master state, but let the caller queue a single snapshot
+            # for git commit once its entire batch is done (see magic_fill)
+            self.client.cache.set_state(state, user=self.client.master_user, queue_master_changes=False)
+        else:
+            self.client.master_state = state
         return was_set
 
     #
@@ -528,24 +607,36 @@ class BSController:
             members=True,
             header=True,
             do_type_search=True,
+            defer_commit=False,
             **kwargs
     ):
         state: State = state if state is not None else self.get_state(user=user, priority=SchedSpeed.FAST)
         user = user or state.user
-        master_state = self.client.master_state
+        # reuse the master state handed down by bulk fillers (fill_functions and friends);
+        # every read of client.master_state deep-copies the state, which is O(artifacts)
+        master_state = master_state if master_state is not None else self.client.master_state
         artifact_type = artifact_type if artifact_type is not None else artifact.__class__
         # TODO: make this work for multiple identifiers (stack vars)
         identifier = identifiers[0]
 
         # find the state getter and artifact dict for the artifact
         art_dict = self.artifact_dict_map[artifact_type]
-        art_state_getter = self.ARTIFACT_GET_MAP[artifact_type]
+        art_state_getter = self.ARTIFACT_GET_ONE[artifact_type]
 
         # construct and merge the incoming changes from user (or target state) into the master
         # state (which also maybe defined by an artifact being passed in)
         master_artifact = artifact if artifact else art_state_getter(master_state, *identifiers)
         target_artifact = art_state_getter(state, *identifiers)
+        sync_key = (user, artifact_type, identifier)
+        target_last_change = target_artifact.last_change if target_artifact is not None else None
         if target_artifact is not None:
+            # the source user has not pushed a newer version since our last successful fill,
+            # so pulling, merging, and re-setting it in the decompiler would be a no-op
+            if artifact is None and target_last_change is not None \
+                    and self._last_sync_ts.get(sync_key) == target_last_change:
+                _l.debug("Skipping fill of %s from %s, unchanged since last sync", target_artifact, user)
+                return False
+
             # specify to BinSync that this is not user-changed, but merged from someone else
             target_artifact.reset_last_change()
 
@@ -586,7 +677,10 @@ class BSController:
                 # TODO: figure out a way to do this inside LibBS (getting all comments for a func)
                 if artifact_type is Function:
                     for addr, cmt in state.get_func_comments(merged_artifact.addr).items():
-                        self.fill_artifact(addr, artifact_type=Comment, artifact=cmt, state=state, user=user)
+                        self.fill_artifact(
+                            addr, artifact_type=Comment, artifact=cmt, state=state, user=user,
+                            defer_commit=defer_commit
+                        )
 
                 fill_changes = True
             except Exception as e:
@@ -598,8 +692,14 @@ class BSController:
             else f"No new changes or failed to sync from {state.user} for {merged_artifact}"
         )
 
+        if fill_changes and target_last_change is not None:
+            self._last_sync_ts[sync_key] = target_last_change
+
         if blocking:
-            self.commit_artifact(merged_artifact, set_last_change=False, commit_msg=commit_msg, from_user=user)
+            self.commit_artifact(
+                merged_artifact, set_last_change=False, commit_msg=commit_msg, from_user=user,
+                defer_commit=defer_commit
+            )
         else:
             self.schedule_job(
                 self.commit_artifact,
@@ -607,21 +707,23 @@ class BSController:
                 set_last_change=False,
                 commit_msg=commit_msg,
                 from_user=user,
+                defer_commit=defer_commit,
             )
 
         return fill_changes
 
-    def fill_functions(self, user=None, do_type_search=True, **kwargs):
+    def fill_functions(self, user=None, do_type_search=True, defer_commit=False, **kwargs):
         change = False
         master_state, state = self.get_master_and_user_state(user=user, **kwargs)
         for addr, func in state.functions.items():
             change |= self.fill_artifact(
-                addr, artifact_type=Function, state=state, master_state=master_state, do_type_search=do_type_search
+                addr, artifact_type=Function, state=state, master_state=master_state, do_type_search=do_type_search,
+                defer_commit=defer_commit
             )
 
         return change
 
-    def fill_structs(self, user=None, **kwargs):
+    def fill_structs(self, user=None, defer_commit=False, **kwargs):
         """
         Grab all the structs from a specified user, then fill them locally
 
@@ -630,21 +732,29 @@ class BSController:
         @return:
         """
         changes = False
-        # only do struct headers for circular references
         master_state, state = self.get_master_and_user_state(user=user, **kwargs)
-        for name, struct in state.structs.items():
+        targets = list(state.structs.items())
+
+        # only do struct headers first, for circular references
+        for name, struct in targets:
             changes |= self.fill_artifact(
-                name, artifact_type=Struct, user=user, state=state, master_state=master_state, members=False
+                name, artifact_type=Struct, user=user, state=state, master_state=master_state, members=False,
+                defer_commit=defer_commit
             )
 
-        for name, struct in state.structs.items():
+        for name, struct in targets:
+            # header-only structs were fully synced by the first pass
+            if not struct.members:
+                continue
+
             changes |= self.fill_artifact(
-                name, artifact_type=Struct, user=user, state=state, master_state=master_state, header=False
+                name, artifact_type=Struct, user=user, state=state, master_state=master_state, header=False,
+                defer_commit=defer_commit
             )
 
         return changes
 
-    def fill_enums(self, user=None, do_type_search=True, **kwargs):
+    def fill_enums(self, user=None, do_type_search=True, defer_commit=False, **kwargs):
         """
         Grab all enums and fill it locally
 
@@ -657,29 +767,29 @@ class BSController:
         for name, enum in state.enums.items():
             changes |= self.fill_artifact(
                 name, artifact_type=Enum, user=user, state=state, master_state=master_state,
-                do_type_search=do_type_search
+                do_type_search=do_type_search, defer_commit=defer_commit
             )
 
         return changes
 
-    def fill_global_vars(self, user=None, do_type_search=True, **kwargs):
+    def fill_global_vars(self, user=None, do_type_search=True, defer_commit=False, **kwargs):
         changes = False
         master_state, state = self.get_master_and_user_state(user=user, **kwargs)
         for off, gvar in state.global_vars.items():
             changes |= self.fill_artifact(
                 off, artifact_type=GlobalVariable, user=user, state=state, master_state=master_state,
-                do_type_search=do_type_search
+                do_type_search=do_type_search, defer_commit=defer_commit
             )
 
         return changes
 
-    def fill_typedefs(self, user=None, do_type_search=True, **kwargs):
+    def fill_typedefs(self, user=None, do_type_search=True, defer_commit=False, **kwargs):
         changes = False
         master_state, state = self.get_master_and_user_state(user=user, **kwargs)
         for name, typedef in state.typedefs.items():
             changes |= self.fill_artifact(
                 name, artifact_type=Typedef, user=user, state=state, master_state=master_state,
-                do_type_search=do_type_search
+                do_type_search=do_type_search, defer_commit=defer_commit
             )
 
         return changes
@@ -700,11 +810,21 @@ class BSController:
             self.fill_enums, self.fill_global_vars, self.fill_functions
         ]
         changes = False
-        # need to do structs specially
-        changes |= self.fill_structs(user=user, state=state, master_state=master_state)
+        # defer git commits while filling so the entire sync lands as a single snapshot
+        # commit instead of one commit per artifact (same batching magic_fill uses)
+        try:
+            # need to do structs specially
+            changes |= self.fill_structs(user=user, state=state, master_state=master_state, defer_commit=True)
 
-        for filler in fillers:
-            changes |= filler(user=user, state=state, master_state=master_state, do_type_search=False)
+            for filler in fillers:
+                changes |= filler(
+                    user=user, state=state, master_state=master_state, do_type_search=False, defer_commit=True
+                )
+        finally:
+            # always cap the deferred batch, even if a filler raised, so the updates are
+            # never left dirty in the cache with no snapshot queued; a change-free
+            # snapshot diffs empty and produces no commit
+            self.client.queue_master_state_commit()
 
         return changes
 
@@ -750,34 +870,40 @@ class BSController:
             Enum: self.fill_artifact
         }
 
-        for artifact_type, filler_func in target_artifacts.items():
-            _l.info(f"Magic Syncing artifacts of type {artifact_type.__name__} now...")
-            pref_state = users_state_map[preference_user]
-            for identifier in self.changed_artifacts_of_type(artifact_type, users=all_users + [preference_user],
-                                                             states=users_state_map):
-                pref_art = self.pull_artifact(artifact_type, identifier, state=pref_state)
-                for user in all_users:
-                    user_state = users_state_map[user]
-                    user_art = self.pull_artifact(artifact_type, identifier, state=user_state)
-
-                    if not user_art:
-                        continue
-
-                    if not pref_art:
-                        pref_art = user_art.copy()
-
-                    pref_art = pref_art.nonconflict_merge(user_art)
-                    pref_art.last_change = None
-
-                _l.debug(f"Filling artifact {pref_art} now...")
-                try:
-                    filler_func(
-                        identifier, artifact_type=artifact_type, artifact=pref_art, state=master_state,
-                        commit_msg=f"Magic Synced {pref_art}",
-                        merge_level=MergeLevel.NON_CONFLICTING
-                    )
-                except Exception as e:
-                    _l.info(f"Banishing exception: {e}")
+        try:
+            for artifact_type, filler_func in target_artifacts.items():
+                _l.info(f"Magic Syncing artifacts of type {artifact_type.__name__} now...")
+                pref_state = users_state_map[preference_user]
+                for identifier in self.changed_artifacts_of_type(artifact_type, users=all_users + [preference_user],
+                                                                 states=users_state_map):
+                    pref_art = self.pull_artifact(artifact_type, identifier, state=pref_state)
+                    for user in all_users:
+                        user_state = users_state_map[user]
+                        user_art = self.pull_artifact(artifact_type, identifier, state=user_state)
+
+                        if not user_art:
+                            continue
+
+                        if not pref_art:
+                            pref_art = user_art.copy()
+
+                        pref_art = pref_art.nonconflict_merge(user_art)
+                        pref_art.last_change = None
+
+                    _l.debug(f"Filling artifact {pref_art} now...")
+                    try:
+                        filler_func(
+                            identifier, artifact_type=artifact_type, artifact=pref_art, state=master_state,
+                            master_state=master_state, commit_msg=f"Magic Synced {pref_art}",
+                            merge_level=MergeLevel.NON_CONFLICTING, defer_commit=True
+                        )
+                    except Exception as e:
+                        _l.info(f"Banishing exception: {e}")
+        finally:
+            # every fill above deferred its git commit; queue one snapshot with all of them.
+            # always cap the batch, even on an aborted sync, so deferred updates are never
+            # left dirty in the cache with no snapshot queued for commit
+            self.client.queue_master_state_commit()
 
         _l.info("Magic Syncing Completed!")
 
@@ -894,26 +1020,16 @@ class BSController:
         return merge_art
 
     def changed_artifacts_of_type(self, type_: Artifact, users=[], states={}):
-        prop_map = {
-            Function: "functions",
-            Comment: "comments",
-            GlobalVariable: "global_vars",
-            Struct: "structs",
-            Enum: "enums"
-        }
-
         try:
-            prop_name = prop_map[type_]
+            getter = _ARTIFACT_DICT_GETTERS[type_]
         except KeyError:
             _l.warning(f"Attempted to get changed artifacts of type {type_} which is unsupported")
             return set()
 
         known_arts = set()
         for username in users:
-            state = states[username]
-            artifact_dict: Dict = getattr(state, prop_name)
-            for identifier in artifact_dict:
-                known_arts.add(identifier)
+            # attrgetter + set.update keep the per-user work at the C level
+            known_arts.update(getter(states[username]))
 
         return known_arts
 
@@ -961,16 +1077,19 @@ class BSController:
         if not type_str:
             return None, None
 
-        type_: CType = self.deci.type_parser.parse_type(type_str)
-        if not type_:
-            # it was not parseable
-            return None, None
+        # a sync sweep parses the same handful of type strings over and over (every int,
+        # char*, ... on every stack var), so cache the parser verdict; only the membership
+        # check against the live state below needs to run per call
+        try:
+            base_type_str = self._parsed_type_cache[type_str]
+        except KeyError:
+            type_: "CType" = self.deci.type_parser.parse_type(type_str)
+            # unparseable and known types both resolve to no user-defined base type
+            base_type_str = type_.base_type.type if type_ and type_.is_unknown else None
+            self._parsed_type_cache[type_str] = base_type_str
 
-        # type is known and parseable
-        if not type_.is_unknown:
+        if base_type_str is None:
             return None, None
-
-        base_type_str = type_.base_type.type
         # this could go wrong in overlapps of type names
         for type_name, type_list in ((Struct, state.structs.keys()), (Enum, state.enums.keys()), (Typedef, state.typedefs.keys())):
             if base_type_str in type_list:
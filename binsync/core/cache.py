@@ -17,6 +17,9 @@ class Cache:
         self._master_user = master_user
         self._master_state = None
         self.queued_master_state_changes = Queue()
+        # True while the master state holds deferred updates that no queued snapshot has
+        # captured yet (set_state with queue_master_changes=False); cleared on any queue
+        self._unqueued_master_changes = False
 
     def clear_state_cache(self, username_commit_dict: dict):
         for username, commit in username_commit_dict.items():
@@ -57,11 +60,15 @@ class Cache:
     # setters
     #
 
-    def set_state(self, state, user=None, **kwargs):
+    def set_state(self, state, user=None, queue_master_changes=True, **kwargs):
         copied_state = state.copy()
         if not user or user == self._master_user:
             with self.master_state_lock:
-                self.queued_master_state_changes.put_nowait(copied_state)
+                if queue_master_changes:
+                    self.queued_master_state_changes.put_nowait(copied_state)
+                    self._unqueued_master_changes = False
+                else:
+                    self._unqueued_master_changes = True
                 self._master_state = copied_state
         else:
             with self.state_lock:
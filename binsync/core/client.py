@@ -5,7 +5,7 @@ import re
 import subprocess
 import datetime
 from functools import wraps
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 from pathlib import Path
 
 import filelock
@@ -143,6 +143,9 @@ class Client:
         self._last_commit_time = None # type: datetime.datetime
 
         self.active_remote = True
+        # whether the most recent pull moved any branch head; starts True so the first
+        # update cycle after connecting is never delayed by pull backoff
+        self.last_pull_had_updates = True
         # force a state update on init
         self.master_state = self.get_state(no_cache=True)
 
@@ -310,6 +313,16 @@ class Client:
 
         return users
 
+    @atomic_git_action
+    def user_names(self, priority=None, no_cache=False) -> List[str]:
+        """
+        Lists the names of every user in the project straight from the branch names,
+        without checking out or parsing any user metadata. Much cheaper than users()
+        when only the names are needed.
+        """
+        ref_dict = self._get_best_refs(self.repo)
+        return [name for name in ref_dict if name != "__root__"]
+
     @atomic_git_action
     def get_state(self, user=None, priority=None, no_cache=False):
         if user is None:
@@ -387,7 +400,32 @@ class Client:
                 no_checkout=i > 0
             )
 
-        self.cache._master_state._dirty = False
+        with self.cache.master_state_lock:
+            # deferred updates that were never capped with a queued snapshot must keep
+            # reading as dirty local changes, or they would silently go uncommitted until
+            # some unrelated edit happened to queue one
+            if not self.cache._unqueued_master_changes and self.cache._master_state is not None:
+                self.cache._master_state._dirty = False
+
+    def has_local_changes(self) -> bool:
+        """
+        True when master state changes are waiting to be committed or pushed out.
+        """
+        if not self.cache.queued_master_state_changes.empty():
+            return True
+
+        with self.cache.master_state_lock:
+            return self.cache._master_state is not None and self.cache._master_state.dirty
+
+    def queue_master_state_commit(self):
+        """
+        Queues the current master state for commit on the next update cycle. Used to cap
+        off a series of deferred (no-commit) master state updates with a single snapshot.
+        """
+        with self.cache.master_state_lock:
+            if self.cache._master_state is not None:
+                self.cache.queued_master_state_changes.put_nowait(self.cache._master_state.copy())
+                self.cache._unqueued_master_changes = False
 
     def commit_and_update_states(self, commit_msg=None):
         """
@@ -454,6 +492,7 @@ class Client:
         except Exception:
             return
 
+        branch_heads = {b.name: b.commit.hexsha for b in self.repo.branches}
         with self.repo.git.custom_environment(**env):
             # dangerous remote operations happen here
             try:
@@ -481,6 +520,10 @@ class Client:
                 #l.debug(f"Failed to merge on {branch} with {e}")
                 pass
 
+        # report whether this pull actually moved anything (new branches count), so the
+        # controller can back off its pull cadence while the remote is quiet
+        self.last_pull_had_updates = branch_heads != {b.name: b.commit.hexsha for b in self.repo.branches}
+
         self._update_cache()
 
     @atomic_git_action
@@ -534,7 +577,7 @@ class Client:
             try:
                 local_name = re.findall(f"({self.remote}/)(.*)", branch.name)[0][1]
             except IndexError:
-                print("INDEX ERROR")
+                l.debug("Failed to localize remote branch name %s", branch.name)
                 continue
 
             # never try to track things already tracked
@@ -607,27 +650,27 @@ class Client:
         # parse output
         m = re.search(r"Found ssh-agent at (\d+)", stdout)
         if m is None:
-            print("Failed to find 'Found ssh-agent at'")
+            l.debug("Failed to find 'Found ssh-agent at'")
             m = re.search(r"SSH_AGENT_PID=(\d+);", stdout)
             if m is None:
-                print("Failed to find SSH_AGENT_PID")
+                l.debug("Failed to find SSH_AGENT_PID")
                 return None, None
-            print("Found SSH_AGENT_PID")
+            l.debug("Found SSH_AGENT_PID")
             ssh_agent_pid = int(m.group(1))
             m = re.search("SSH_AUTH_SOCK=(.*?);", stdout)
             if m is None:
-                print("Failed to find SSH_AUTH_SOCK")
+                l.debug("Failed to find SSH_AUTH_SOCK")
                 return None, None
-            print("Found SSH_AGENT_SOCK")
+            l.debug("Found SSH_AGENT_SOCK")
             ssh_agent_sock = m.group(1)
         else :
-            print("Found ssh-agent at")
+            l.debug("Found ssh-agent at")
             ssh_agent_pid = int(m.group(1))
             m = re.search(r"Found ssh-agent socket at ([^\s]+)", stdout)
             if m is None:
-                print("Failed to find 'Found ssh-agent socket at'")
+                l.debug("Failed to find 'Found ssh-agent socket at'")
                 return None, None
-            print("Found ssh-agent socket at")
+            l.debug("Found ssh-agent socket at")
             ssh_agent_sock = m.group(1)
 
         return ssh_agent_pid, ssh_agent_sock
@@ -1,6 +1,7 @@
+import heapq
+import itertools
 import threading
 import logging
-from queue import PriorityQueue
 from threading import Thread
 
 _l = logging.getLogger(__name__)
@@ -13,11 +14,17 @@ class SchedSpeed:
 
 
 class FailedJob:
+    __slots__ = ("reason",)
+
     def __init__(self, reason):
         self.reason = reason
 
 
 class Job:
+    # one Job is allocated per scheduled git/decompiler op; slots keep them small and
+    # make the frequent attribute hits (execute, finish_event waits) C-descriptor fast
+    __slots__ = ("function", "args", "kwargs", "ret_value", "exception", "finish_event")
+
     def __init__(self, function, *args, **kwargs):
         self.function = function
         self.args = args
@@ -41,20 +48,24 @@ class Job:
     def __repr__(self):
         return self.__str__()
 
-    def __lt__(self, other):
-        return True
-
-
 class Scheduler:
     def __init__(self, sleep_interval=0.05, name="Scheduler"):
         self.sleep_interval = sleep_interval
         self.name = name
         self._worker = Thread(target=self._worker_thread)
-        self._job_queue = PriorityQueue()
+        # plain heap under a condition variable: cheaper than PriorityQueue and, unlike
+        # a blocking queue get, lets stop_worker_thread() actually wake the worker
+        self._job_heap = []
+        self._job_cv = threading.Condition()
+        # monotonic tiebreaker so equal-priority jobs stay FIFO and Job objects
+        # (which define no ordering) are never compared by the heap
+        self._job_counter = itertools.count()
         self._work = False
 
     def stop_worker_thread(self):
-        self._work = False
+        with self._job_cv:
+            self._work = False
+            self._job_cv.notify_all()
 
     def start_worker_thread(self):
         self._work = True
@@ -62,16 +73,26 @@ class Scheduler:
         self._worker.start()
 
     def _worker_thread(self):
-        while self._work:
-            self._complete_a_job(block=True)
+        while True:
+            with self._job_cv:
+                while self._work and not self._job_heap:
+                    self._job_cv.wait()
+
+                if not self._work:
+                    return
+
+                _, _, job = heapq.heappop(self._job_heap)
+
+            # execute outside the lock so schedulers are never blocked by a running job
+            self._execute_job(job)
 
     def schedule_job(self, job: Job, priority=SchedSpeed.SLOW):
         if not self._work:
             _l.warning("%s is not currently set to work, but you are still scheduling a job...", self.name)
 
-        self._job_queue.put_nowait(
-            (priority, job,)
-        )
+        with self._job_cv:
+            heapq.heappush(self._job_heap, (priority, next(self._job_counter), job,))
+            self._job_cv.notify()
 
     def schedule_and_wait_job(self, job: Job, priority=SchedSpeed.SLOW, timeout=30):
         self.schedule_job(job, priority=priority)
@@ -85,16 +106,29 @@ class Scheduler:
             else:
                 raise job.exception
 
-    def _complete_a_job(self, block=False):
-        if block:
-            _, job = self._job_queue.get()
-        elif self._job_queue.not_empty:
-            _, job = self._job_queue.get_nowait()
-        else:
-            return
+    def jobs_pending(self):
+        with self._job_cv:
+            return bool(self._job_heap)
 
+    def _pop_job(self):
+        with self._job_cv:
+            return heapq.heappop(self._job_heap)[-1] if self._job_heap else None
+
+    def _execute_job(self, job: Job):
         _l.debug("%s: completing scheduled job now: %s", self.name, job)
         job.execute()
 
         if job.exception:
             _l.exception("%s: exception in scheduled job %s: %s", self.name, job, job.exception)
+
+    def drain_jobs(self):
+        """
+        Completes every job currently sitting in the queue without blocking. Useful for
+        consumers that want to batch-process a burst of scheduled jobs in one pass.
+        """
+        while True:
+            job = self._pop_job()
+            if job is None:
+                break
+
+            self._execute_job(job)
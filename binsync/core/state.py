@@ -8,6 +8,12 @@ from typing import Dict, Optional, Union, List
 
 import git
 import toml
+# tomllib (3.11+) parses markedly faster than the pure-python toml package, which is
+# still needed for dumping (tomllib is read-only)
+try:
+    import tomllib
+except ImportError:
+    tomllib = toml
 from sortedcontainers import SortedDict
 
 
@@ -183,7 +189,7 @@ def file_to_str(src: Union[pathlib.Path, git.Tree], filename, client=None) -> Op
 
 def toml_file_to_dict(src: Union[pathlib.Path, git.Tree], filename, client=None):
     file_data = file_to_str(src, filename, client=client)
-    return toml.loads(file_data) if file_data is not None else file_data
+    return tomllib.loads(file_data) if file_data is not None else file_data
 
 
 def toml_file_to_artifact(src: Union[pathlib.Path, git.Tree], filename, artifact_cls, client=None) -> Optional[Artifact]:
@@ -125,17 +125,22 @@ class GlobalTableModel(BinsyncTableModel):
         if not updated_row_keys:
             return False
 
-        row_update_idxs = [
-            idx for idx, row_key in enumerate(row_data.keys())
-            if row_key in updated_row_keys
-        ]
+        # keys are insertion-ordered and never removed, so the key->row map only needs
+        # rebuilding when rows were appended
+        if len(self._row_of) != len(row_data) or not updated_row_keys <= self._row_of.keys():
+            self._row_of = {row_key: idx for idx, row_key in enumerate(row_data.keys())}
+        row_update_idxs = [self._row_of[row_key] for row_key in updated_row_keys]
 
         # send update signal for everything in row data, with new colors
         self.update_signal.emit(list(row_data.values()))
 
-        # ask for in-row updates (in UI) to any single row changed
-        for update_idx in row_update_idxs:
-            self.dataChanged.emit(self.index(0, update_idx), self.index(self.rowCount() - 1, update_idx))
+        # ask for a single in-row update (in UI) spanning every changed row; one emit
+        # means one viewport repaint instead of one per changed row
+        if row_update_idxs:
+            self.dataChanged.emit(
+                self.index(min(row_update_idxs), 0),
+                self.index(max(row_update_idxs), self.columnCount() - 1)
+            )
 
     def contextMenuEvent(self, event):
         pass
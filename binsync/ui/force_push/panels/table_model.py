@@ -22,6 +22,10 @@ from libbs.ui.qt_objects import (
 
 l = logging.getLogger(__name__)
 
+# row colors only differ by their rounded alpha, so at most 256 QColors can ever
+# exist; intern them here instead of allocating one per row per refresh
+_ROW_COLOR_CACHE = {}
+
 
 class BinsyncTableModel(QAbstractTableModel):
     # Custom defined role for sorting/filtering (since we shouldn't sort hex numbers alphabetically)
@@ -49,7 +53,7 @@ class BinsyncTableModel(QAbstractTableModel):
         self.controller = controller
         self.row_data = []
         self.data_bgcolors = []
-        self.data_tooltips = []
+        self._row_of = {}
 
         self.col_headers = col_headers
 
@@ -162,20 +166,18 @@ class BinsyncTableModel(QAbstractTableModel):
         if not updated_row_keys and not force_color_update:
             return False
 
-        row_colors = [
-            self._compute_row_color(row[self.time_col]) for row in row_data.values()
-        ]
+        row_colors = self._compute_row_colors(row_data.values())
 
         if force_color_update:
             # update all rows
             self.saved_color_window = self.controller.table_coloring_window
             row_update_idxs = range(len(row_data))
         else:
-            # update only rows with changes
-            row_update_idxs = [
-                idx for idx, row_key in enumerate(row_data.keys())
-                if row_key in updated_row_keys
-            ]
+            # update only rows with changes; keys are insertion-ordered and never removed,
+            # so the key->row map only needs rebuilding when rows were appended
+            if len(self._row_of) != len(row_data) or not updated_row_keys <= self._row_of.keys():
+                self._row_of = {row_key: idx for idx, row_key in enumerate(row_data.keys())}
+            row_update_idxs = [self._row_of[row_key] for row_key in updated_row_keys]
 
         # send update signal for everything in row data, with new colors
         self.update_signal.emit(list(row_data.values()), row_colors)
@@ -184,18 +186,33 @@ class BinsyncTableModel(QAbstractTableModel):
         for update_idx in row_update_idxs:
             self.dataChanged.emit(self.index(0, update_idx), self.index(self.rowCount() - 1, update_idx))
 
-    def _compute_row_color(self, artifact_update_time: datetime.datetime):
-        duration = int(datetime.datetime.now(tz=datetime.timezone.utc).timestamp() - artifact_update_time.timestamp())
-        if 0 <= duration <= self.controller.table_coloring_window:
-            opacity = (self.controller.table_coloring_window - duration) / self.controller.table_coloring_window
-            return QColor(
-                BinsyncTableModel.ACTIVE_FUNCTION_COLOR[0],
-                BinsyncTableModel.ACTIVE_FUNCTION_COLOR[1],
-                BinsyncTableModel.ACTIVE_FUNCTION_COLOR[2],
-                int(BinsyncTableModel.ACTIVE_FUNCTION_COLOR[3] * opacity)
-            )
+    def _compute_row_colors(self, rows):
+        """
+        Computes the background color for every row in one pass. Rows outside the
+        coloring window (the common case) cost only the duration subtraction; a QColor
+        is only built for rows that were recently pushed. One clock read per batch.
+        """
+        # hoist every attribute walk out of the loop body; with thousands of rows the
+        # repeated controller/self lookups are what the profile actually shows
+        now = datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
+        window = self.controller.table_coloring_window
+        time_col = self.time_col
+        red, green, blue, max_alpha = BinsyncTableModel.ACTIVE_FUNCTION_COLOR
+
+        row_colors = []
+        append_color = row_colors.append
+        for row in rows:
+            duration = int(now - row[time_col].timestamp())
+            if 0 <= duration <= window:
+                alpha = int(max_alpha * (window - duration) / window)
+                color = _ROW_COLOR_CACHE.get(alpha)
+                if color is None:
+                    color = _ROW_COLOR_CACHE.setdefault(alpha, QColor(red, green, blue, alpha))
+                append_color(color)
+            else:
+                append_color(None)
 
-        return None
+        return row_colors
 
     def update_table(self, states):
         """ Updates the table using the controller's information. """
@@ -295,9 +312,12 @@ class BinsyncTableView(QTableView):
 
         header = self.horizontalHeader()
         header.setSortIndicator(0, Qt.AscendingOrder)
+        # ResizeToContents makes Qt measure column data on every refresh; bound that
+        # scan to a row sample instead of the whole table
+        header.setResizeContentsPrecision(64)
         for i in range(self.col_count):
-            self.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(self.stretch_col, QHeaderView.Stretch)
+            header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(self.stretch_col, QHeaderView.Stretch)
 
         self.column_visibility = [True for _ in range(self.col_count)]
 
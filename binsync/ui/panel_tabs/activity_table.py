@@ -8,12 +8,10 @@ from binsync.controller import BSController
 from binsync.ui.panel_tabs.table_model import BinsyncTableModel, BinsyncTableFilterLineEdit, BinsyncTableView
 from libbs.ui.qt_objects import (
     QMenu,
-    QAction,
     QWidget,
     QVBoxLayout,
     Qt
 )
-from binsync.ui.utils import friendly_datetime
 from binsync.core.scheduler import SchedSpeed
 from libbs.artifacts import Function
 
@@ -41,7 +39,7 @@ class ActivityTableModel(BinsyncTableModel):
                 data = self.row_data[row][col]
                 return hex(self.row_data[row][col]) if data != -1 else ""
             elif col == 2:
-                return friendly_datetime(self.row_data[row][col])
+                return self.friendly_time(self.row_data[row][col])
         elif role == self.SortRole:
             if col == self.time_col and isinstance(self.row_data[row][col], datetime.datetime):
                 return time.mktime(self.row_data[row][col].timetuple())
@@ -50,9 +48,6 @@ class ActivityTableModel(BinsyncTableModel):
             return self.data_bgcolors[row]
         elif role == self.FilterRole:
             return f"{self.row_data[row][0]} {hex(self.row_data[row][1])}"
-        elif role == Qt.ToolTipRole:
-            #return self.data_tooltips[row]
-            pass
         return None
 
     def update_table(self, states):
@@ -142,14 +137,7 @@ class ActivityTableView(BinsyncTableView):
         elif not (0 <= selected_row < len(self.model.row_data)) or not idx.isValid():
             valid_row = False
 
-        col_hide_menu = menu.addMenu("Show Columns")
-        handler = lambda ind: lambda: self._col_hide_handler(ind)
-        for i, c in enumerate(self.HEADER):
-            act = QAction(c, parent=menu)
-            act.setCheckable(True)
-            act.setChecked(self.column_visibility[i])
-            act.triggered.connect(handler(i))
-            col_hide_menu.addAction(act)
+        menu.addMenu(self._col_hide_menu)
 
         if valid_row:
             func_addr = self.model.row_data[idx.row()][1]
@@ -8,10 +8,8 @@ from binsync.controller import BSController
 from binsync.ui.panel_tabs.table_model import BinsyncTableModel, BinsyncTableView
 from libbs.ui.qt_objects import (
     QMenu,
-    QAction,
     Qt
 )
-from binsync.ui.utils import friendly_datetime
 
 l = logging.getLogger(__name__)
 
@@ -29,24 +27,23 @@ class CTXTableModel(BinsyncTableModel):
         if not index.isValid():
             return None
 
+        # data() is the hot path of every paint: bind the row list once and order the
+        # role checks by how often Qt queries them so unhandled roles fall out fast
         col = index.column()
-        row = index.row()
+        row_item = self.row_data[index.row()]
         if role == Qt.DisplayRole:
             if col == 0 or col == 1:
-                return self.row_data[row][col]
+                return row_item[col]
             elif col == 2:
-                return friendly_datetime(self.row_data[row][col])
-        elif role == self.SortRole:
-            if col == self.time_col and isinstance(self.row_data[row][col], datetime.datetime):
-                return time.mktime(self.row_data[row][col].timetuple())
-            return self.row_data[row][col]
+                return self.friendly_time(row_item[col])
         elif role == Qt.BackgroundRole:
-            return self.data_bgcolors[row]
+            return self.data_bgcolors[index.row()]
+        elif role == self.SortRole:
+            if col == self.time_col and isinstance(row_item[col], datetime.datetime):
+                return time.mktime(row_item[col].timetuple())
+            return row_item[col]
         elif role == self.FilterRole:
-            return self.row_data[row][0] + " " + self.row_data[row][1]
-        elif role == Qt.ToolTipRole:
-            #return self.data_tooltips[row]
-            pass
+            return row_item[0] + " " + row_item[1]
         return None
 
     def update_table(self, states, new_ctx=None):
@@ -59,6 +56,7 @@ class CTXTableModel(BinsyncTableModel):
         if new_ctx and self.saved_ctx != new_ctx:
             self.saved_ctx = new_ctx
             self.data_dict = {}
+            self._row_of = {}
 
         updated_row_keys = set()
         for state in states:
@@ -107,14 +105,7 @@ class QCTXTable(BinsyncTableView):
         elif not (0 <= selected_row < len(self.model.row_data)) or not idx.isValid():
             valid_row = False
 
-        col_hide_menu = menu.addMenu("Show Columns")
-        handler = lambda ind: lambda: self._col_hide_handler(ind)
-        for i, c in enumerate(self.HEADER):
-            act = QAction(c, parent=menu)
-            act.setCheckable(True)
-            act.setChecked(self.column_visibility[i])
-            act.triggered.connect(handler(i))
-            col_hide_menu.addAction(act)
+        menu.addMenu(self._col_hide_menu)
 
         if valid_row and self.model.saved_ctx:
             user_name = self.model.row_data[idx.row()][0]
@@ -2,19 +2,15 @@ import datetime
 import logging
 import time
 from typing import Dict
-from collections import defaultdict
 
 from binsync.controller import BSController
 from binsync.ui.panel_tabs.table_model import BinsyncTableModel, BinsyncTableFilterLineEdit, BinsyncTableView
 from libbs.ui.qt_objects import (
     QMenu,
-    QAction,
     QWidget,
     QVBoxLayout,
     Qt
 )
-from binsync.ui.utils import friendly_datetime
-from binsync.core.scheduler import SchedSpeed
 from libbs.artifacts import Function
 
 l = logging.getLogger(__name__)
@@ -26,48 +22,62 @@ class FunctionTableModel(BinsyncTableModel):
         super().__init__(controller, col_headers, filter_cols, time_col, addr_col, parent)
         self.data_dict = {}
         self.context_menu_cache = {}
+        self._user_push_times = {}
+        self._cmenu_funcs_by_user = {}
 
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
 
+        # data() is the hot path of every paint: bind the row list once and order the
+        # role checks by how often Qt queries them so unhandled roles fall out fast
         col = index.column()
-        row = index.row()
+        row_item = self.row_data[index.row()]
         if role == Qt.DisplayRole:
             if col == 0:
-                return hex(self.row_data[row][col])
+                return hex(row_item[col])
             elif col == 1 or col == 2:
-                return self.row_data[row][col]
+                return row_item[col]
             elif col == 3:
-                return friendly_datetime(self.row_data[row][col])
-        elif role == self.SortRole:
-            if col == self.time_col and isinstance(self.row_data[row][col], datetime.datetime):
-                return time.mktime(self.row_data[row][col].timetuple())
-            return self.row_data[row][col]
+                return self.friendly_time(row_item[col])
         elif role == Qt.BackgroundRole:
-            return self.data_bgcolors[row]
+            return self.data_bgcolors[index.row()]
+        elif role == self.SortRole:
+            if col == self.time_col and isinstance(row_item[col], datetime.datetime):
+                return time.mktime(row_item[col].timetuple())
+            return row_item[col]
         elif role == self.FilterRole:
-            return f"{hex(self.row_data[row][0])} {self.row_data[row][1]} {self.row_data[row][2]}"
-        elif role == Qt.ToolTipRole:
-            #return self.data_tooltips[index.row()]
-            pass
+            return f"{hex(row_item[0])} {row_item[1]} {row_item[2]}"
         return None
 
     def update_table(self, states):
-        cmenu_cache = defaultdict(list)
+        # each user state carries its last push time, so an unchanged mapping means no
+        # function in any state could have advanced: skip the users x functions sweep
+        new_push_times = {state.user: state.last_push_time for state in states}
+        if new_push_times == self._user_push_times and \
+                self.controller.table_coloring_window == self.saved_color_window:
+            self.refresh_time_cells()
+            return
+
         updated_row_keys = set()
 
         # grab all the new info from user states
         for state in states:
-            user_funcs: Dict[int, Function] = state.functions
             user_name = state.user
+            # per-user watermark: an unchanged push time means none of this user's
+            # functions advanced, so their rows and menu entries are already correct
+            if self._user_push_times.get(user_name) == new_push_times[user_name]:
+                continue
+
+            user_funcs: Dict[int, Function] = state.functions
+            changed_funcs = []
             for func_addr, sync_func in user_funcs.items():
                 func_change_time = sync_func.last_change
                 # don't add functions that were never changed by the user
                 if not func_change_time:
                     continue
 
-                cmenu_cache[func_addr].append(user_name)
+                changed_funcs.append(func_addr)
 
                 # skip updating existent, older, functions
                 if func_addr in self.data_dict and \
@@ -79,10 +89,24 @@ class FunctionTableModel(BinsyncTableModel):
                 ]
                 updated_row_keys.add(func_addr)
 
-        self.context_menu_cache = cmenu_cache
+            self._swap_cmenu_entries(user_name, changed_funcs)
+
+        self._user_push_times = new_push_times
         self._update_changed_rows(self.data_dict, updated_row_keys)
         self.refresh_time_cells()
 
+    def _swap_cmenu_entries(self, user_name, changed_funcs):
+        """ Replaces a user's context-menu entries, leaving other users' untouched. """
+        for func_addr in self._cmenu_funcs_by_user.get(user_name, ()):
+            users = self.context_menu_cache.get(func_addr)
+            if users and user_name in users:
+                users.remove(user_name)
+
+        for func_addr in changed_funcs:
+            self.context_menu_cache.setdefault(func_addr, []).append(user_name)
+
+        self._cmenu_funcs_by_user[user_name] = changed_funcs
+
 class FunctionTableView(BinsyncTableView):
     HEADER = ['Addr', 'Remote Name', 'User', 'Last Push']
 
@@ -100,27 +124,10 @@ class FunctionTableView(BinsyncTableView):
 
     def _get_valid_users_for_func(self, func_addr):
         """ Helper function for getting users that have changes in a given function """
-        if func_addr in self.model.context_menu_cache:
-            for username in self.model.context_menu_cache[func_addr]:
-                yield username
-        else:
-            for user in self.controller.client.check_cache_(self.controller.client.users,
-                                                            priority=SchedSpeed.FAST, no_cache=False):
-                # only populate with cached items to prevent main thread waiting on atomic actions
-                cache_item = self.controller.client.check_cache_(self.controller.client.get_state, user=user.name,
-                                                                 priority=SchedSpeed.FAST)
-                if cache_item is not None:
-                    user_state = cache_item
-                else:
-                    continue
-
-                user_func = user_state.get_function(func_addr)
-
-                # function must be changed by this user
-                if not user_func or not user_func.last_change:
-                    continue
-
-                yield user.name
+        # update_table sweeps every changed function of every user into the cache, so a
+        # miss means no user has touched this function yet; never fall back to per-user
+        # state fetches, which would block the UI thread on the git scheduler
+        return self.model.context_menu_cache.get(func_addr, [])
 
     def contextMenuEvent(self, event):
         menu = QMenu(self)
@@ -136,14 +143,7 @@ class FunctionTableView(BinsyncTableView):
         elif not (0 <= selected_row < len(self.model.row_data)) or not idx.isValid():
             valid_row = False
 
-        col_hide_menu = menu.addMenu("Show Columns")
-        handler = lambda ind: lambda: self._col_hide_handler(ind)
-        for i, c in enumerate(self.HEADER):
-            act = QAction(c, parent=menu)
-            act.setCheckable(True)
-            act.setChecked(self.column_visibility[i])
-            act.triggered.connect(handler(i))
-            col_hide_menu.addAction(act)
+        menu.addMenu(self._col_hide_menu)
 
         if valid_row:
             func_addr = self.model.row_data[idx.row()][0]
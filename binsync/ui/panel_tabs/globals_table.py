@@ -9,12 +9,10 @@ from binsync.controller import BSController
 from binsync.ui.panel_tabs.table_model import BinsyncTableModel, BinsyncTableFilterLineEdit, BinsyncTableView
 from libbs.ui.qt_objects import (
     QMenu,
-    QAction,
     QWidget,
     QVBoxLayout,
     Qt
 )
-from binsync.ui.utils import friendly_datetime
 from binsync.core.scheduler import SchedSpeed
 
 l = logging.getLogger(__name__)
@@ -42,7 +40,7 @@ class GlobalsTableModel(BinsyncTableModel):
             elif col in (GlobalsTableView.COL_NAME, GlobalsTableView.COL_USER):
                 return val
             elif col == GlobalsTableView.COL_DATE:
-                return friendly_datetime(val)
+                return self.friendly_time(val)
         elif role == self.SortRole:
             if col == self.time_col and isinstance(val, datetime.datetime):
                 return time.mktime(val.timetuple())
@@ -56,9 +54,6 @@ class GlobalsTableModel(BinsyncTableModel):
                              hexaddr,
                              self.row_data[row][GlobalsTableView.COL_NAME],
                              self.row_data[row][GlobalsTableView.COL_USER]))
-        elif role == Qt.ToolTipRole:
-            # return self.data_tooltips[index.row()]
-            pass
         return None
 
     def update_table(self, states):
@@ -177,14 +172,7 @@ class GlobalsTableView(BinsyncTableView):
         elif not (0 <= selected_row < len(self.model.row_data)) or not idx.isValid():
             valid_row = False
 
-        col_hide_menu = menu.addMenu("Show Columns")
-        handler = lambda ind: lambda: self._col_hide_handler(ind)
-        for i, c in enumerate(self.HEADER):
-            act = QAction(c, parent=menu)
-            act.setCheckable(True)
-            act.setChecked(self.column_visibility[i])
-            act.triggered.connect(handler(i))
-            col_hide_menu.addAction(act)
+        menu.addMenu(self._col_hide_menu)
 
         if valid_row:
             global_type = self.model.row_data[idx.row()][self.COL_TYPE]
@@ -1,13 +1,17 @@
 import logging
 import datetime
+from functools import partial
 from typing import Dict, Set
 
 from binsync.controller import BSController
+from binsync.ui.utils import friendly_datetime
 from libbs.ui.qt_objects import (
     QAbstractItemView,
     QAbstractTableModel,
+    QAction,
     QHeaderView,
     Qt,
+    QMenu,
     QModelIndex,
     QSortFilterProxyModel,
     QColor,
@@ -22,6 +26,10 @@ from libbs.ui.qt_objects import (
 
 l = logging.getLogger(__name__)
 
+# row colors only differ by their rounded alpha, so at most 256 QColors can ever
+# exist; intern them here instead of allocating one per row per refresh
+_ROW_COLOR_CACHE = {}
+
 
 class BinsyncTableModel(QAbstractTableModel):
     # Custom defined role for sorting/filtering (since we shouldn't sort hex numbers alphabetically)
@@ -49,7 +57,8 @@ class BinsyncTableModel(QAbstractTableModel):
         self.controller = controller
         self.row_data = []
         self.data_bgcolors = []
-        self.data_tooltips = []
+        self._time_str_cache = {}
+        self._row_of = {}
 
         self.col_headers = col_headers
 
@@ -147,7 +156,23 @@ class BinsyncTableModel(QAbstractTableModel):
             on the role supplied. This function is performance sensitive. """
         raise NotImplementedError
 
+    def friendly_time(self, timestamp):
+        """
+        Memoized friendly_datetime for DisplayRole paints. Relative times only advance
+        when refresh_time_cells clears the memo, so repeated paints of the same cell
+        (scrolling, repaints) become a dict lookup instead of a strftime/timedelta call.
+        """
+        try:
+            return self._time_str_cache[timestamp]
+        except KeyError:
+            time_str = friendly_datetime(timestamp)
+            self._time_str_cache[timestamp] = time_str
+            return time_str
+
     def refresh_time_cells(self):
+        # relative time strings go stale once we ask for a repaint of the time column
+        self._time_str_cache.clear()
+
         # always update every column in the table that contains time
         self.dataChanged.emit(
             self.createIndex(0, self.time_col),
@@ -162,40 +187,57 @@ class BinsyncTableModel(QAbstractTableModel):
         if not updated_row_keys and not force_color_update:
             return False
 
-        row_colors = [
-            self._compute_row_color(row[self.time_col]) for row in row_data.values()
-        ]
+        row_colors = self._compute_row_colors(row_data.values())
 
         if force_color_update:
             # update all rows
             self.saved_color_window = self.controller.table_coloring_window
             row_update_idxs = range(len(row_data))
         else:
-            # update only rows with changes
-            row_update_idxs = [
-                idx for idx, row_key in enumerate(row_data.keys())
-                if row_key in updated_row_keys
-            ]
+            # update only rows with changes; keys are insertion-ordered and never removed,
+            # so the key->row map only needs rebuilding when rows were appended
+            if len(self._row_of) != len(row_data) or not updated_row_keys <= self._row_of.keys():
+                self._row_of = {row_key: idx for idx, row_key in enumerate(row_data.keys())}
+            row_update_idxs = [self._row_of[row_key] for row_key in updated_row_keys]
 
         # send update signal for everything in row data, with new colors
         self.update_signal.emit(list(row_data.values()), row_colors)
 
-        # ask for in-row updates (in UI) to any single row changed
-        for update_idx in row_update_idxs:
-            self.dataChanged.emit(self.index(0, update_idx), self.index(self.rowCount() - 1, update_idx))
-
-    def _compute_row_color(self, artifact_update_time: datetime.datetime):
-        duration = int(datetime.datetime.now(tz=datetime.timezone.utc).timestamp() - artifact_update_time.timestamp())
-        if 0 <= duration <= self.controller.table_coloring_window:
-            opacity = (self.controller.table_coloring_window - duration) / self.controller.table_coloring_window
-            return QColor(
-                BinsyncTableModel.ACTIVE_FUNCTION_COLOR[0],
-                BinsyncTableModel.ACTIVE_FUNCTION_COLOR[1],
-                BinsyncTableModel.ACTIVE_FUNCTION_COLOR[2],
-                int(BinsyncTableModel.ACTIVE_FUNCTION_COLOR[3] * opacity)
+        # ask for a single in-row update (in UI) spanning every changed row; one emit
+        # means one viewport repaint instead of one per changed row
+        if row_update_idxs:
+            self.dataChanged.emit(
+                self.index(min(row_update_idxs), 0),
+                self.index(max(row_update_idxs), self.columnCount() - 1)
             )
 
-        return None
+    def _compute_row_colors(self, rows):
+        """
+        Computes the background color for every row in one pass. Rows outside the
+        coloring window (the common case) cost only the duration subtraction; a QColor
+        is only built for rows that were recently pushed. One clock read per batch.
+        """
+        # hoist every attribute walk out of the loop body; with thousands of rows the
+        # repeated controller/self lookups are what the profile actually shows
+        now = datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
+        window = self.controller.table_coloring_window
+        time_col = self.time_col
+        red, green, blue, max_alpha = BinsyncTableModel.ACTIVE_FUNCTION_COLOR
+
+        row_colors = []
+        append_color = row_colors.append
+        for row in rows:
+            duration = int(now - row[time_col].timestamp())
+            if 0 <= duration <= window:
+                alpha = int(max_alpha * (window - duration) / window)
+                color = _ROW_COLOR_CACHE.get(alpha)
+                if color is None:
+                    color = _ROW_COLOR_CACHE.setdefault(alpha, QColor(red, green, blue, alpha))
+                append_color(color)
+            else:
+                append_color(None)
+
+        return row_colors
 
     def update_table(self, states):
         """ Updates the table using the controller's information. """
@@ -271,7 +313,7 @@ class BinsyncTableView(QTableView):
         row = self.model.row_data[tls_row_idx.row()]
         self.controller.deci.gui_goto(row[self.model.addr_col])
 
-    def _col_hide_handler(self, index):
+    def _col_hide_handler(self, index, checked=False):
         """ Helper function to hide/show columns from context menu """
         self.column_visibility[index] = not self.column_visibility[index]
         self.setColumnHidden(index, self.column_visibility[index])
@@ -295,12 +337,25 @@ class BinsyncTableView(QTableView):
 
         header = self.horizontalHeader()
         header.setSortIndicator(0, Qt.AscendingOrder)
+        # ResizeToContents makes Qt measure column data on every refresh; bound that
+        # scan to a row sample instead of the whole table
+        header.setResizeContentsPrecision(64)
         for i in range(self.col_count):
-            self.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(self.stretch_col, QHeaderView.Stretch)
+            header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(self.stretch_col, QHeaderView.Stretch)
 
         self.column_visibility = [True for _ in range(self.col_count)]
 
+        # the column-hide submenu never changes shape, so build it (and its actions)
+        # once here instead of allocating closures on every contextMenuEvent
+        self._col_hide_menu = QMenu("Show Columns", self)
+        for i, col_name in enumerate(self.model.col_headers):
+            act = QAction(col_name, parent=self._col_hide_menu)
+            act.setCheckable(True)
+            act.setChecked(self.column_visibility[i])
+            act.triggered.connect(partial(self._col_hide_handler, i))
+            self._col_hide_menu.addAction(act)
+
         fixed_width_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
         fixed_width_font.setPointSize(11)
         self.setFont(fixed_width_font)
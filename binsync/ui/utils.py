@@ -165,7 +165,7 @@ class BSUIScheduler(QObject, Scheduler):
         self._work = True
 
     def stop(self):
-        self._work = False
+        self.stop_worker_thread()
 
     def run(self):
         self._worker_thread()
@@ -79,6 +79,46 @@ class TestClient(unittest.TestCase):
             assert commits[1].message == f"Updated {sv_0}"
             assert commits[2].message == f"Updated {fh_0}"
 
+    def test_deferred_commit_batching(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = Client("user0", tmpdir, "fake_hash", init_repo=True)
+            state = client.master_state
+            client.commit_master_state()
+            base_commits = len(list(client.repo.iter_commits()))
+
+            # deferred updates (the commit_artifact(defer_commit=True) path) change the
+            # cached master state without queueing a snapshot per change
+            fh_0 = FunctionHeader("some_name", self.FAKE_ADDR)
+            state.set_function_header(fh_0)
+            client.cache.set_state(state, user="user0", queue_master_changes=False)
+
+            sv_0 = StackVariable(-0x10, "u0_var", "int", 4, self.FAKE_ADDR)
+            state.set_stack_variable(sv_0)
+            client.cache.set_state(state, user="user0", queue_master_changes=False)
+
+            assert client.cache.queued_master_state_changes.empty() is True
+            assert client.has_local_changes() is True
+
+            # an update cycle that fires before the batch is capped must neither commit
+            # the deferred changes nor stop them reading as pending local changes
+            client.commit_master_state()
+            assert len(list(client.repo.iter_commits())) == base_commits
+            assert client.has_local_changes() is True
+
+            # capping the batch yields exactly one commit containing every deferred artifact
+            client.queue_master_state_commit()
+            client.commit_master_state()
+            assert len(list(client.repo.iter_commits())) == base_commits + 1
+            assert client.has_local_changes() is False
+
+            # ignore cache and grab the master state from the git repo
+            state = client.get_state(user="user0", no_cache=True)
+            func = state.functions[self.FAKE_ADDR]
+            assert func.header == fh_0
+            assert func.stack_vars[-0x10] == sv_0
+
+            client.shutdown()
+
     def test_multi_user_branch_loading(self):
         with tempfile.TemporaryDirectory() as tmpdir:
 